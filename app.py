@@ -4,14 +4,23 @@ from chromadb.config import Settings
 from langchain_openai import OpenAIEmbeddings, ChatOpenAI
 from langchain_community.vectorstores import Chroma
 from langchain.chains import ConversationalRetrievalChain
-from langchain.memory import ConversationBufferMemory
+from langchain.memory import ConversationBufferWindowMemory
 from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_community.document_loaders import PyPDFLoader
-from langchain.schema import Document
-import os
+from langchain.schema import Document, BaseRetriever
+from langchain.callbacks.base import BaseCallbackHandler
+from langchain.callbacks.manager import CallbackManagerForRetrieverRun
+from langchain_core.embeddings import Embeddings
+from openai import AsyncOpenAI
+import asyncio
+import hashlib
+import pickle
 import tempfile
+import numpy as np
+import re
+import fitz
+import os
 from dotenv import load_dotenv
-from typing import List
+from typing import List, Optional, Tuple
 import uuid
 
 # Load environment variables
@@ -35,7 +44,7 @@ if not api_key:
     st.sidebar.title("🔑 API Key Required")
     api_key = st.sidebar.text_input("Enter your OpenAI API key:", type="password", help="Enter your OpenAI API key to use the app")
     if api_key:
-        os.environ["OPENAI_API_KEY"] = api_key
+        # Keep the key in this session only; os.environ is shared by every session
         st.sidebar.success("✅ API key saved for this session")
     else:
         st.warning("⚠️ Please enter your OpenAI API key in the sidebar to continue.")
@@ -60,67 +69,404 @@ if "pdf_documents" not in st.session_state:
     st.session_state.pdf_documents = {}
 if "memory" not in st.session_state:
     st.session_state.memory = None
+if "vector_index" not in st.session_state:
+    st.session_state.vector_index = None
+if "doc_hashes" not in st.session_state:
+    # Content hashes of the PDFs processed in this session; retrieval is scoped to them
+    st.session_state.doc_hashes = []
+if "id_prefix" not in st.session_state:
+    # One random prefix per session keeps ids unique in the persisted collection
+    st.session_state.id_prefix = uuid.uuid4().hex
+if "next_id" not in st.session_state:
+    st.session_state.next_id = 0
+if "vectorstore_epoch" not in st.session_state:
+    # Bumped whenever documents are added, so the cached QA chain can be rebuilt
+    st.session_state.vectorstore_epoch = 0
+if "qa_chain" not in st.session_state:
+    st.session_state.qa_chain = None
+    st.session_state.qa_chain_epoch = None
 
-def process_pdf(file) -> List[Document]:
-    """Process PDF file and return chunked documents with page numbers"""
-    # Save uploaded file to temporary location
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-        tmp_file.write(file.read())
-        tmp_path = tmp_file.name
-    
+# Embedding model shared by ingest and query embeddings
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_DIMENSIONS = 512
+
+# Optional local ONNX model (e.g. bge-small-en-v1.5 INT8) that replaces OpenAI embeddings
+LOCAL_EMBEDDING_MODEL = os.environ.get("LOCAL_EMBEDDING_MODEL")
+if LOCAL_EMBEDDING_MODEL:
+    EMBEDDING_MODEL = os.path.splitext(os.path.basename(LOCAL_EMBEDDING_MODEL))[0]
+    # bge-small outputs 384 dimensions; set LOCAL_EMBEDDING_DIMENSIONS for other exports
+    EMBEDDING_DIMENSIONS = int(os.environ.get("LOCAL_EMBEDDING_DIMENSIONS", 384))
+
+# Vectors from different models or widths can't share a collection, so the name follows
+# the embedding settings (Chroma allows 3-63 characters from [a-zA-Z0-9._-],
+# starting and ending with a letter or digit)
+COLLECTION_NAME = re.sub(
+    r"[^a-zA-Z0-9._-]", "-", f"pdf_chat_collection_{EMBEDDING_MODEL}_{EMBEDDING_DIMENSIONS}"
+)[:63].rstrip("._-")
+
+# HNSW parameters for small, ingest-heavy collections (tens of thousands of chunks at most).
+# Chroma applies them only when a collection is created, which COLLECTION_NAME guarantees
+# for new embedding settings; existing collections keep the parameters they were built with
+HNSW_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:M": 8,
+    "hnsw:construction_ef": 64,
+    "hnsw:search_ef": 32,
+}
+
+# Below this many vectors brute-force search beats walking the HNSW graph
+BRUTE_FORCE_MAX_VECTORS = 5000
+
+# Processed chunks and their vectors, keyed by a hash of the PDF bytes.
+# Bump CACHE_VERSION whenever the pickled layout or the chunking changes.
+CACHE_DIR = "./cache"
+CACHE_VERSION = 3
+
+def extract_pdf_texts(data: bytes) -> List[str]:
+    """Extract plain text for every page of a PDF"""
+    # Extraction stays in-process: PyMuPDF is not thread-safe, and worker
+    # processes would re-run this script and each receive a copy of the PDF
+    with fitz.open(stream=data, filetype="pdf") as doc:
+        return [page.get_text("text") for page in doc]
+
+def get_cache_path(doc_hash: str) -> str:
+    """Return the cache file for a PDF's content hash under the current cache and embedding settings"""
+    return os.path.join(
+        CACHE_DIR, f"{doc_hash}-v{CACHE_VERSION}-{EMBEDDING_MODEL}-{EMBEDDING_DIMENSIONS}.pkl"
+    )
+
+def load_from_cache(cache_path: str) -> Optional[Tuple[List[Document], int, List[List[float]]]]:
+    """Return cached chunks, page count and vectors, or None on a miss or an unreadable file"""
     try:
-        # Load PDF
-        loader = PyPDFLoader(tmp_path)
-        pages = loader.load()
-        
-        # Add metadata with page numbers
-        for i, page in enumerate(pages):
-            page.metadata['page_number'] = i + 1
-            page.metadata['source_file'] = file.name
-        
-        # Split documents into chunks
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1000,
-            chunk_overlap=200,
-            length_function=len,
+        with open(cache_path, "rb") as f:
+            chunks, num_pages, codes, alpha, shift = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (EOFError, pickle.UnpicklingError, ValueError):
+        # Truncated or foreign file: drop it so the next upload rebuilds it
+        try:
+            os.remove(cache_path)
+        except FileNotFoundError:
+            pass
+        return None
+    return chunks, num_pages, dequantize_embeddings(codes, alpha, shift).tolist()
+
+def save_to_cache(cache_path: str, chunks: List[Document], num_pages: int, vectors: List[List[float]]):
+    """Store processed chunks and their 8-bit quantized vectors for repeat uploads"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    codes, alpha, shift = quantize_embeddings(vectors)
+    # Write to a temp file and rename it into place, so concurrent uploads or a
+    # crash mid-write never leave a truncated cache file behind
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((chunks, num_pages, codes, alpha, shift), f)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+def deduplicate_chunks(chunks: List[Document]) -> List[Document]:
+    """Drop repeated chunks (headers, footers, repeated tables) before embedding"""
+    seen = {}
+    unique = []
+    for chunk in chunks:
+        first = seen.get(chunk.page_content)
+        if first is None:
+            seen[chunk.page_content] = chunk
+            unique.append(chunk)
+        else:
+            # Chroma metadata values must be scalars, so record pages as "3,7,12"
+            page = str(chunk.metadata['page_number'])
+            also_pages = first.metadata.get('also_pages')
+            first.metadata['also_pages'] = f"{also_pages},{page}" if also_pages else page
+    return unique
+
+def process_pdf(file) -> Tuple[List[Document], int, Optional[List[List[float]]], str]:
+    """Process PDF file and return chunked documents with page numbers.
+    
+    Also returns the PDF's page count, the cached vectors for a previously processed PDF (or None)
+    and the cache path to store new vectors under.
+    """
+    # Open the uploaded bytes directly instead of round-tripping through a temp file
+    data = file.read()
+    
+    # The content hash identifies the PDF in both the cache and the Chroma collection
+    doc_hash = hashlib.sha256(data).hexdigest()
+    cache_path = get_cache_path(doc_hash)
+    cached = load_from_cache(cache_path)
+    if cached is not None:
+        chunks, num_pages, vectors = cached
+        # The same PDF may be uploaded again under a different name
+        for chunk in chunks:
+            chunk.metadata['source_file'] = file.name
+            chunk.metadata['doc_hash'] = doc_hash
+        return chunks, num_pages, vectors, cache_path
+    
+    # Load PDF with page numbers in the metadata
+    texts = extract_pdf_texts(data)
+    pages = [
+        Document(
+            page_content=text,
+            metadata={"page_number": i + 1, "source_file": file.name, "doc_hash": doc_hash}
         )
-        chunks = text_splitter.split_documents(pages)
+        for i, text in enumerate(texts)
+    ]
+    
+    # Split documents into chunks measured in embedding-model tokens
+    text_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+        encoding_name="cl100k_base",
+        chunk_size=400,
+        chunk_overlap=40,
+    )
+    chunks = text_splitter.split_documents(pages)
+    
+    return deduplicate_chunks(chunks), len(texts), None, cache_path
+
+def quantize_embeddings(vectors: List[List[float]]):
+    """Scalar-quantize each vector to 8-bit codes with its own scale and offset"""
+    matrix = np.asarray(vectors, dtype=np.float32)
+    shift = matrix.min(axis=1)
+    alpha = (matrix.max(axis=1) - shift) / 255
+    # Guard against constant vectors, which would divide by zero
+    alpha[alpha == 0] = 1.0
+    codes = np.round((matrix - shift[:, None]) / alpha[:, None]).astype(np.uint8)
+    return codes, alpha, shift
+
+def dequantize_embeddings(codes: np.ndarray, alpha: np.ndarray, shift: np.ndarray) -> np.ndarray:
+    """Decode 8-bit codes back to float32 vectors"""
+    return codes.astype(np.float32) * alpha[:, None] + shift[:, None]
+
+class VectorIndex:
+    """In-memory float32 matrix of this session's chunk embeddings for exact search"""
+    
+    def __init__(self):
+        self.vectors = np.empty((0, EMBEDDING_DIMENSIONS), dtype=np.float32)
+        self.documents: List[Document] = []
+    
+    def add(self, vectors: List[List[float]], documents: List[Document]):
+        self.vectors = np.vstack([self.vectors, np.asarray(vectors, dtype=np.float32)])
+        self.documents.extend(documents)
+    
+    def search(self, query_vector: List[float], k: int) -> List[Document]:
+        """Return the k documents with the highest cosine similarity to the query"""
+        k = min(k, len(self.documents))
+        if k == 0:
+            return []
+        # Embeddings are unit-length, so the dot product is the cosine similarity
+        scores = self.vectors @ np.asarray(query_vector, dtype=np.float32)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [self.documents[i] for i in top]
+
+class BruteForceRetriever(BaseRetriever):
+    """Retriever that brute-forces the session's VectorIndex instead of Chroma's HNSW graph"""
+    index: VectorIndex
+    embeddings: Embeddings
+    k: int = 3
+    
+    class Config:
+        arbitrary_types_allowed = True
+    
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        return self.index.search(self.embeddings.embed_query(query), self.k)
+
+class OnnxEmbeddings(Embeddings):
+    """Local bge-small embeddings run with ONNX Runtime on CPU"""
+    
+    # bge models expect this instruction in front of retrieval queries
+    query_instruction = "Represent this sentence for searching relevant passages: "
+    
+    def __init__(self, model_path: str, dimensions: int, batch_size: int = 64, max_length: int = 512):
+        # Optional dependencies, only needed when a local model is configured
+        import onnxruntime
+        from tokenizers import Tokenizer
+        
+        self.session = onnxruntime.InferenceSession(model_path, providers=["CPUExecutionProvider"])
+        self.input_names = {model_input.name for model_input in self.session.get_inputs()}
+        # tokenizer.json is expected next to the model file
+        self.tokenizer = Tokenizer.from_file(os.path.join(os.path.dirname(model_path), "tokenizer.json"))
+        self.tokenizer.enable_padding()
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.batch_size = batch_size
         
-        return chunks
+        # The index, cache key and collection name all assume this width
+        output_dimensions = len(self._embed(["dimension check"])[0])
+        if output_dimensions != dimensions:
+            raise ValueError(
+                f"Local embedding model {model_path} produces {output_dimensions}-dimension vectors, "
+                f"but {dimensions} are expected. Set LOCAL_EMBEDDING_DIMENSIONS={output_dimensions}."
+            )
+    
+    def _embed(self, texts: List[str]) -> List[List[float]]:
+        vectors = []
+        for start in range(0, len(texts), self.batch_size):
+            encodings = self.tokenizer.encode_batch(texts[start:start + self.batch_size])
+            inputs = {
+                "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+                "attention_mask": np.array([e.attention_mask for e in encodings], dtype=np.int64),
+                "token_type_ids": np.array([e.type_ids for e in encodings], dtype=np.int64),
+            }
+            output = self.session.run(
+                None, {name: value for name, value in inputs.items() if name in self.input_names}
+            )[0]
+            # Exports either return last_hidden_state (batch, seq, dim), where bge uses the
+            # [CLS] token, or an already pooled sentence embedding (batch, dim)
+            pooled = output[:, 0] if output.ndim == 3 else output
+            vectors.append(pooled / np.linalg.norm(pooled, axis=1, keepdims=True))
+        return np.concatenate(vectors).tolist() if vectors else []
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._embed(texts)
+    
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed([self.query_instruction + text])[0]
+
+class StreamHandler(BaseCallbackHandler):
+    """Render LLM tokens into a Streamlit placeholder as they arrive"""
+    
+    def __init__(self, container):
+        self.container = container
+        self.text = ""
+    
+    def on_llm_new_token(self, token: str, **kwargs) -> None:
+        self.text += token
+        self.container.markdown(self.text + "▌")
+
+async def embed_all(texts: List[str], api_key: str, batch: int = 256, concurrency: int = 8) -> List[List[float]]:
+    """Embed texts with concurrent batched requests, preserving input order"""
+    client = AsyncOpenAI(api_key=api_key)
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def embed_batch(start: int) -> List[List[float]]:
+        async with semaphore:
+            response = await client.embeddings.create(
+                model=EMBEDDING_MODEL,
+                input=texts[start:start + batch],
+                dimensions=EMBEDDING_DIMENSIONS
+            )
+        return [item.embedding for item in response.data]
+    
+    try:
+        results = await asyncio.gather(*(embed_batch(i) for i in range(0, len(texts), batch)))
     finally:
-        # Clean up temporary file
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+        await client.close()
+    
+    return [vector for vectors in results for vector in vectors]
+
+def embed_documents(documents: List[Document]) -> List[List[float]]:
+    """Embed documents locally if configured, otherwise with concurrent OpenAI requests"""
+    texts = [doc.page_content for doc in documents]
+    if LOCAL_EMBEDDING_MODEL:
+        return get_embeddings(api_key).embed_documents(texts)
+    return asyncio.run(embed_all(texts, api_key))
 
-def create_vectorstore(documents: List[Document]):
+def add_embedded_documents(vectorstore, documents: List[Document], vectors: List[List[float]], ids: List[str]):
+    """Add one PDF's chunks with pre-computed vectors to the collection and the session"""
+    if not documents:
+        return
+    doc_hash = documents[0].metadata['doc_hash']
+    if doc_hash in st.session_state.doc_hashes:
+        return
+    
+    # Each PDF is stored once; a session processing a stored PDF reads its chunks back
+    if not vectorstore._collection.get(where={"doc_hash": doc_hash}, limit=1)["ids"]:
+        # Insert pre-computed vectors directly so Chroma doesn't embed again
+        vectorstore._collection.add(
+            ids=ids,
+            embeddings=vectors,
+            documents=[doc.page_content for doc in documents],
+            metadatas=[doc.metadata for doc in documents]
+        )
+    
+    st.session_state.vector_index.add(vectors, documents)
+    st.session_state.doc_hashes.append(doc_hash)
+    st.session_state.vectorstore_epoch += 1
+
+@st.cache_resource
+def get_embeddings(api_key: str) -> Embeddings:
+    """Shared embeddings client; with OpenAI, documents are embedded by embed_all"""
+    if LOCAL_EMBEDDING_MODEL:
+        return OnnxEmbeddings(LOCAL_EMBEDDING_MODEL, EMBEDDING_DIMENSIONS)
+    
+    # chunk_size=2048 is the maximum number of inputs per embeddings request
+    return OpenAIEmbeddings(
+        model=EMBEDDING_MODEL,
+        dimensions=EMBEDDING_DIMENSIONS,
+        chunk_size=2048,
+        show_progress_bar=False,
+        openai_api_key=api_key
+    )
+
+@st.cache_resource
+def get_llm(api_key: str, streaming: bool = False) -> ChatOpenAI:
+    """Shared chat model client"""
+    return ChatOpenAI(
+        model_name="gpt-3.5-turbo",
+        temperature=0,
+        streaming=streaming,
+        openai_api_key=api_key
+    )
+
+@st.cache_resource
+def get_chroma_client():
+    """Shared ChromaDB client so the persisted index is opened once per process"""
+    return chromadb.PersistentClient(path="./chroma_db")
+
+def next_ids(count: int) -> List[str]:
+    """Allocate sequential chunk ids from the session counter"""
+    start = st.session_state.next_id
+    st.session_state.next_id += count
+    prefix = st.session_state.id_prefix
+    return [f"{prefix}:{i}" for i in range(start, start + count)]
+
+def create_vectorstore(documents: List[Document], vectors: List[List[float]]):
     """Create ChromaDB vectorstore with documents"""
-    # Initialize embeddings (will use OPENAI_API_KEY from environment)
-    embeddings = OpenAIEmbeddings()
-    collection_name = "pdf_chat_collection"
-    
-    # Create vectorstore
-    vectorstore = Chroma.from_documents(
-        documents=documents,
-        embedding=embeddings,
-        collection_name=collection_name,
-        persist_directory="./chroma_db"
+    embeddings = get_embeddings(api_key)
+    
+    # Create vectorstore on the shared client
+    vectorstore = Chroma(
+        client=get_chroma_client(),
+        collection_name=COLLECTION_NAME,
+        embedding_function=embeddings,
+        collection_metadata=HNSW_METADATA
     )
+    st.session_state.vector_index = VectorIndex()
+    ids = next_ids(len(documents))
+    add_embedded_documents(vectorstore, documents, vectors, ids)
     
     return vectorstore
 
-def add_to_vectorstore(vectorstore, documents: List[Document]):
+def add_to_vectorstore(vectorstore, documents: List[Document], vectors: List[List[float]]):
     """Add documents to existing vectorstore"""
-    ids = [str(uuid.uuid4()) for _ in documents]
-    vectorstore.add_documents(documents=documents, ids=ids)
+    ids = next_ids(len(documents))
+    add_embedded_documents(vectorstore, documents, vectors, ids)
     return vectorstore
 
+def get_retriever(vectorstore, k: int = 3) -> BaseRetriever:
+    """Search this session's PDFs, brute-force when they are small and HNSW otherwise"""
+    index = st.session_state.vector_index
+    if len(index.documents) < BRUTE_FORCE_MAX_VECTORS:
+        return BruteForceRetriever(index=index, embeddings=vectorstore.embeddings, k=k)
+    # Restrict HNSW to the same PDFs the brute-force index holds
+    return vectorstore.as_retriever(
+        search_kwargs={"k": k, "filter": {"doc_hash": {"$in": st.session_state.doc_hashes}}}
+    )
+
 def get_qa_chain(vectorstore):
-    """Create a QA chain with memory"""
-    llm = ChatOpenAI(model_name="gpt-3.5-turbo", temperature=0)
+    """Return the session's QA chain with memory, rebuilding it only when documents change"""
+    if (st.session_state.qa_chain is not None
+            and st.session_state.qa_chain_epoch == st.session_state.vectorstore_epoch):
+        return st.session_state.qa_chain
     
-    # Initialize or reuse memory
+    llm = get_llm(api_key, streaming=True)
+    
+    # Initialize or reuse memory (last 4 exchanges keep prompt size flat)
     if st.session_state.memory is None:
-        st.session_state.memory = ConversationBufferMemory(
+        st.session_state.memory = ConversationBufferWindowMemory(
+            k=4,
             memory_key="chat_history",
             return_messages=True,
             output_key="answer"
@@ -129,12 +475,16 @@ def get_qa_chain(vectorstore):
     # Create retrieval chain
     qa_chain = ConversationalRetrievalChain.from_llm(
         llm=llm,
-        retriever=vectorstore.as_retriever(search_kwargs={"k": 3}),
+        # Condense follow-ups without streaming so only the answer reaches the UI
+        condense_question_llm=get_llm(api_key),
+        retriever=get_retriever(vectorstore, k=3),
         memory=st.session_state.memory,
         return_source_documents=True,
         verbose=False
     )
     
+    st.session_state.qa_chain = qa_chain
+    st.session_state.qa_chain_epoch = st.session_state.vectorstore_epoch
     return qa_chain
 
 # Main UI
@@ -155,23 +505,27 @@ with st.sidebar:
             with st.spinner("Processing PDF..."):
                 try:
                     # Process PDF
-                    chunks = process_pdf(uploaded_file)
+                    chunks, num_pages, vectors, cache_path = process_pdf(uploaded_file)
+                    
+                    # Embed chunks unless this PDF was processed before
+                    if vectors is None:
+                        vectors = embed_documents(chunks)
+                        save_to_cache(cache_path, chunks, num_pages, vectors)
                     
                     # Create or update vectorstore
                     if st.session_state.vectorstore is None:
-                        st.session_state.vectorstore = create_vectorstore(chunks)
+                        st.session_state.vectorstore = create_vectorstore(chunks, vectors)
                     else:
                         # Add new documents to existing vectorstore
-                        st.session_state.vectorstore = add_to_vectorstore(st.session_state.vectorstore, chunks)
+                        st.session_state.vectorstore = add_to_vectorstore(st.session_state.vectorstore, chunks, vectors)
                     
                     # Store document metadata
                     st.session_state.pdf_documents[uploaded_file.name] = {
-                        "num_pages": len(set(chunk.metadata.get('page_number', 0) for chunk in chunks)),
+                        "num_pages": num_pages,
                         "num_chunks": len(chunks)
                     }
                     
                     st.success(f"✅ PDF processed successfully! ({len(chunks)} chunks created)")
-                    st.rerun()
                 except Exception as e:
                     st.error(f"Error processing PDF: {str(e)}")
     
@@ -187,6 +541,8 @@ with st.sidebar:
         st.session_state.messages = []
         st.session_state.chat_history = []
         st.session_state.memory = None
+        # The cached chain holds the old memory
+        st.session_state.qa_chain = None
         st.rerun()
 
 # Chat interface
@@ -212,16 +568,18 @@ else:
         
         # Get response
         with st.chat_message("assistant"):
+            answer_placeholder = st.empty()
             with st.spinner("Thinking..."):
                 try:
                     qa_chain = get_qa_chain(st.session_state.vectorstore)
-                    result = qa_chain({"question": prompt})
+                    # Stream answer tokens into the placeholder as they arrive
+                    result = qa_chain({"question": prompt}, callbacks=[StreamHandler(answer_placeholder)])
                     
                     answer = result["answer"]
                     source_documents = result.get("source_documents", [])
                     
                     # Display answer
-                    st.markdown(answer)
+                    answer_placeholder.markdown(answer)
                     
                     # Extract source information
                     sources = []